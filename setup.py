@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+C拡張モジュールのビルド設定
+
+メタデータは pyproject.toml で管理しています。
+Cythonが利用できない場合やビルドに失敗した場合は、純Python実装のみで
+インストールされます。
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "mathematics_simulator.core._fast",
+                ["src/mathematics_simulator/core/_fast.pyx"],
+                optional=True,
+            )
+        ],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)
@@ -8,6 +8,16 @@ __version__ = "0.1.0"
 __author__ = "Developer"
 __email__ = "developer@example.com"
 
-from .core.coordinate_system import CoordinateSystem
-
 __all__ = ["CoordinateSystem"]
+
+
+def __getattr__(name: str) -> object:
+    """
+    公開クラスを初回アクセス時にインポート (PEP 562)
+
+    パッケージのインポートだけでNumPyなどの重い依存が読み込まれないようにします。
+    """
+    if name == "CoordinateSystem":
+        from .core.coordinate_system import CoordinateSystem
+        return CoordinateSystem
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
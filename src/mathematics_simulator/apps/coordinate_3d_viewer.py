@@ -3,8 +3,12 @@
 3D座標空間ビューア
 
 PySide6とmatplotlibを使用した3D座標系の視覚化アプリケーション
+
+VisPyがインストールされている場合は、OpenGLで描画するウィジェットを使用します。
 """
 
+import importlib.util
+import os
 import sys
 from typing import Optional
 import numpy as np
@@ -20,10 +24,23 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+# vispy は任意依存. 読み込みと Qt バックエンドの選択は重いため、
+# ここでは有無だけを確認し、VisPy ウィジェットの作成時に読み込む
+_HAS_VISPY = importlib.util.find_spec('vispy') is not None
 
 from ..core.coordinate_system import CoordinateSystem
 
 
+# 座標軸の色スキーム
+AXIS_COLORS = {
+    'rgb': ['red', 'green', 'blue'],
+    'xyz': ['red', 'green', 'blue'],
+    'cool': ['cyan', 'magenta', 'yellow']
+}
+
+
 class Matplotlib3DWidget(FigureCanvas):
     """matplotlib 3Dプロット用ウィジェット"""
     
@@ -42,6 +59,9 @@ class Matplotlib3DWidget(FigureCanvas):
         self.ax = self.figure.add_subplot(111, projection='3d')
         self.setup_plot()
         
+        # 描画した座標系のアーティスト（クリア時に個別に削除する）
+        self._artists: list = []
+        
     def setup_plot(self) -> None:
         """3Dプロットの初期設定"""
         self.ax.set_xlabel('X')
@@ -61,7 +81,8 @@ class Matplotlib3DWidget(FigureCanvas):
         self, 
         coord_system: CoordinateSystem, 
         name: str = "CoordSys", 
-        color_scheme: str = 'rgb'
+        color_scheme: str = 'rgb',
+        show_legend: bool = False
     ) -> None:
         """
         座標系を3Dプロットに描画
@@ -70,68 +91,161 @@ class Matplotlib3DWidget(FigureCanvas):
             coord_system: 描画する座標系
             name: 座標系の名前
             color_scheme: 色スキーム ('rgb', 'xyz', 'cool')
+            show_legend: 凡例用のラベル（座標系の名前）を設定するか
         """
         origin = coord_system.get_origin()
-        x_axis = coord_system.get_x_axis()
-        y_axis = coord_system.get_y_axis()
-        z_axis = coord_system.get_z_axis()
+        axes = (coord_system.get_x_axis(), coord_system.get_y_axis(), coord_system.get_z_axis())
         
         # 軸の長さ
         axis_length = 1.5
         
         # 色の設定
-        colors = {
-            'rgb': ['red', 'green', 'blue'],
-            'xyz': ['red', 'green', 'blue'],
-            'cool': ['cyan', 'magenta', 'yellow']
-        }
-        axis_colors = colors.get(color_scheme, colors['rgb'])
-        
-        # X軸（赤）
-        self.ax.quiver(
-            origin[0], origin[1], origin[2],
-            x_axis[0] * axis_length, x_axis[1] * axis_length, x_axis[2] * axis_length,
-            color=axis_colors[0], arrow_length_ratio=0.1, linewidth=3, 
-            label=f'{name}-X'
-        )
+        axis_colors = AXIS_COLORS.get(color_scheme, AXIS_COLORS['rgb'])
         
-        # Y軸（緑）
-        self.ax.quiver(
-            origin[0], origin[1], origin[2],
-            y_axis[0] * axis_length, y_axis[1] * axis_length, y_axis[2] * axis_length,
-            color=axis_colors[1], arrow_length_ratio=0.1, linewidth=3, 
-            label=f'{name}-Y'
+        # 3軸を1つのコレクションとしてまとめて描画（アーティスト数を削減）
+        segments = [[origin, origin + axis * axis_length] for axis in axes]
+        collection = Line3DCollection(
+            segments, colors=axis_colors, linewidths=3,
+            label=name if show_legend else None
         )
+        self.ax.add_collection3d(collection)
         
-        # Z軸（青）
-        self.ax.quiver(
-            origin[0], origin[1], origin[2],
-            z_axis[0] * axis_length, z_axis[1] * axis_length, z_axis[2] * axis_length,
-            color=axis_colors[2], arrow_length_ratio=0.1, linewidth=3, 
-            label=f'{name}-Z'
-        )
+        # 原点は3軸の始点として表示されるため、マーカーは描画しない
+        self._artists.append(collection)
         
-        # 原点をマーク
-        self.ax.scatter(
-            origin[0], origin[1], origin[2], 
-            color='black', s=50, alpha=0.8, label=f'{name} Origin'
-        )
+    def clear_plot(self) -> None:
+        """
+        プロットをクリア
+        
+        axes全体を作り直す代わりに、描画した座標系と凡例のみを削除します。
+        軸ラベル・範囲・グリッドなどの設定はそのまま維持されます。
+        """
+        for artist in self._artists:
+            artist.remove()
+        self._artists.clear()
+        
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        
+    def refresh_plot(self) -> None:
+        """プロットを更新（イベントループ内で描画要求をまとめる）"""
+        self.draw_idle()
+        
+    def add_legend(self) -> None:
+        """凡例を表示"""
+        self.ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        
+    def reset_view(self) -> None:
+        """視点を初期状態に戻す"""
+        self.ax.view_init(elev=20, azim=45)
+
+
+class VispyCoordinateWidget(QWidget):
+    """VisPy (OpenGL) 3Dプロット用ウィジェット"""
+    
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        VisPy 3D ウィジェットを初期化
+        
+        Args:
+            parent: 親ウィジェット
+            
+        Raises:
+            RuntimeError: VisPyがインストールされていない場合
+        """
+        try:
+            import vispy
+            vispy.use(app='pyside6')
+            from vispy import scene
+        except (ImportError, RuntimeError) as e:
+            raise RuntimeError("VisPy is not available") from e
+        self._scene = scene
+        
+        super().__init__(parent)
+        
+        self.canvas = scene.SceneCanvas(keys='interactive', show=False, bgcolor='white')
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.canvas.native)
+        
+        # マウス操作で回転・ズームできるカメラ
+        self.view = self.canvas.central_widget.add_view()
+        self.view.camera = scene.TurntableCamera(fov=45)
+        self.reset_view()
+        
+        # 描画した座標系のビジュアル（クリア時に個別に削除する）
+        self._visuals: list = []
+        
+    def plot_coordinate_system(
+        self, 
+        coord_system: CoordinateSystem, 
+        name: str = "CoordSys", 
+        color_scheme: str = 'rgb',
+        show_legend: bool = False
+    ) -> None:
+        """
+        座標系を3Dプロットに描画
+        
+        Args:
+            coord_system: 描画する座標系
+            name: 座標系の名前（VisPyでは凡例を表示しないため未使用）
+            color_scheme: 色スキーム ('rgb', 'xyz', 'cool')
+            show_legend: 凡例用のラベルを設定するか（VisPyでは未使用）
+        """
+        origin = coord_system.get_origin()
+        axes = (coord_system.get_x_axis(), coord_system.get_y_axis(), coord_system.get_z_axis())
+        
+        # 軸の長さ
+        axis_length = 1.5
+        axis_colors = AXIS_COLORS.get(color_scheme, AXIS_COLORS['rgb'])
+        
+        for axis, color in zip(axes, axis_colors):
+            pos = np.array([origin, origin + axis * axis_length])
+            arrow = self._scene.visuals.Arrow(
+                pos=pos, color=color, width=3, connect='segments',
+                arrows=pos.reshape(1, 6), arrow_size=10,
+                arrow_color=color, parent=self.view.scene
+            )
+            self._visuals.append(arrow)
+        
+        # 原点は3軸の始点として表示されるため、マーカーは描画しない
         
     def clear_plot(self) -> None:
-        """プロットをクリア"""
-        self.ax.clear()
-        self.setup_plot()
+        """描画した座標系を削除"""
+        for visual in self._visuals:
+            visual.parent = None
+        self._visuals.clear()
         
     def refresh_plot(self) -> None:
-        """プロットを更新"""
-        self.draw()
+        """プロットを更新（シーングラフの変更は自動で再描画されるため不要）"""
+        
+    def add_legend(self) -> None:
+        """凡例を表示（VisPyウィジェットでは未対応）"""
+        
+    def reset_view(self) -> None:
+        """視点を初期状態に戻す"""
+        camera = self.view.camera
+        camera.elevation = 20
+        camera.azimuth = 45
+        camera.set_range(x=(-2, 2), y=(-2, 2), z=(-2, 2))
 
 
 class CoordinateSystemViewer(QMainWindow):
     """3D座標系ビューアのメインウィンドウ"""
     
-    def __init__(self) -> None:
-        """メインウィンドウを初期化"""
+    def __init__(self, use_vispy: Optional[bool] = None) -> None:
+        """
+        メインウィンドウを初期化
+        
+        Args:
+            use_vispy: VisPy (OpenGL) ウィジェットを使用するか.
+                デフォルトはVisPyがインストールされていれば使用する.
+                環境変数 MATHSIM_VIEWER_BACKEND=matplotlib でmatplotlibを強制できる
+
+        Raises:
+            RuntimeError: use_vispy=True でVisPyを読み込めない場合
+        """
         super().__init__()
         self.setWindowTitle("3D Coordinate System Viewer")
         self.setGeometry(100, 100, 1200, 800)
@@ -144,13 +258,29 @@ class CoordinateSystemViewer(QMainWindow):
         main_layout = QHBoxLayout(main_widget)
         
         # 3Dプロット部分
-        self.plot_widget = Matplotlib3DWidget()
+        # 自動選択の場合は、VisPy を読み込めなければ matplotlib に切り替える
+        auto_backend = use_vispy is None
+        if use_vispy is None:
+            backend = os.environ.get('MATHSIM_VIEWER_BACKEND', '')
+            use_vispy = _HAS_VISPY and backend != 'matplotlib'
+        if use_vispy:
+            try:
+                self.plot_widget = VispyCoordinateWidget()
+            except RuntimeError:
+                if not auto_backend:
+                    raise
+                self.plot_widget = Matplotlib3DWidget()
+        else:
+            self.plot_widget = Matplotlib3DWidget()
         main_layout.addWidget(self.plot_widget, 2)  # 比率2
         
         # コントロールパネル
         control_panel = self.create_control_panel()
         main_layout.addWidget(control_panel, 1)  # 比率1
         
+        # 最後に描画したシーン（同じ内容の再描画を省略するため）
+        self._drawn_scene: Optional[tuple] = None
+        
         # 初期表示
         self.update_plot()
         
@@ -253,8 +383,31 @@ class CoordinateSystemViewer(QMainWindow):
         
         return panel
         
+    def _custom_parameters(self) -> tuple:
+        """カスタム座標系の現在の入力値 (原点, ロール, ピッチ, ヨー) を取得"""
+        origin = (self.origin_x.value(), self.origin_y.value(), self.origin_z.value())
+        return origin, self.roll.value(), self.pitch.value(), self.yaw.value()
+        
+    def _needs_redraw(self, scene_key: tuple) -> bool:
+        """
+        表示内容が前回の描画から変化したかを判定
+        
+        Args:
+            scene_key: 描画しようとしているシーンの識別情報
+            
+        Returns:
+            再描画が必要な場合True
+        """
+        if scene_key == self._drawn_scene:
+            return False
+        self._drawn_scene = scene_key
+        return True
+        
     def show_world_coordinates(self) -> None:
         """ワールド座標系を表示"""
+        if not self._needs_redraw(('world',)):
+            return
+        
         self.plot_widget.clear_plot()
         
         # ワールド座標系（デフォルト）
@@ -265,13 +418,14 @@ class CoordinateSystemViewer(QMainWindow):
         
     def update_custom_coordinates(self) -> None:
         """カスタム座標系を更新表示"""
+        params = self._custom_parameters()
+        if not self._needs_redraw(('custom', params)):
+            return
+        
         self.plot_widget.clear_plot()
         
         # カスタム座標系をオイラー角から作成
-        origin = [self.origin_x.value(), self.origin_y.value(), self.origin_z.value()]
-        roll = self.roll.value()
-        pitch = self.pitch.value()
-        yaw = self.yaw.value()
+        origin, roll, pitch, yaw = params
         
         custom_coords = CoordinateSystem.from_euler_angles(
             origin, roll, pitch, yaw, 'deg'
@@ -283,37 +437,45 @@ class CoordinateSystemViewer(QMainWindow):
         
     def show_both_systems(self) -> None:
         """両方の座標系を表示"""
+        params = self._custom_parameters()
+        if not self._needs_redraw(('both', params)):
+            return
+        
         self.plot_widget.clear_plot()
         
         # ワールド座標系
         world_coords = CoordinateSystem()
-        self.plot_widget.plot_coordinate_system(world_coords, "World", 'rgb')
+        self.plot_widget.plot_coordinate_system(
+            world_coords, "World", 'rgb', show_legend=True
+        )
         
         # カスタム座標系
-        origin = [self.origin_x.value(), self.origin_y.value(), self.origin_z.value()]
-        roll = self.roll.value()
-        pitch = self.pitch.value()
-        yaw = self.yaw.value()
+        origin, roll, pitch, yaw = params
         
         custom_coords = CoordinateSystem.from_euler_angles(
             origin, roll, pitch, yaw, 'deg'
         )
         
-        self.plot_widget.plot_coordinate_system(custom_coords, "Custom", 'cool')
+        self.plot_widget.plot_coordinate_system(
+            custom_coords, "Custom", 'cool', show_legend=True
+        )
         
         # 凡例を追加
-        self.plot_widget.ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        self.plot_widget.add_legend()
         
         self.plot_widget.refresh_plot()
         
     def clear_plot(self) -> None:
         """プロットをクリア"""
+        if not self._needs_redraw(('clear',)):
+            return
+        
         self.plot_widget.clear_plot()
         self.plot_widget.refresh_plot()
         
     def reset_view(self) -> None:
         """ビューをリセット"""
-        self.plot_widget.ax.view_init(elev=20, azim=45)
+        self.plot_widget.reset_view()
         self.plot_widget.refresh_plot()
         
     def update_plot(self) -> None:
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""_fast.pyx（単一点の座標変換を行うC拡張）の型スタブ"""
+
+import numpy as np
+
+def transform_to_local(R: np.ndarray, origin: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """R.T @ (p - origin) を計算"""
+    ...
+
+def transform_to_global(R: np.ndarray, origin: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """origin + R @ p を計算"""
+    ...
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+単一点の座標変換を行うC拡張（任意）
+
+1点ずつの変換ではNumPyの呼び出しオーバーヘッドが支配的になるため、
+3x3行列と3次元ベクトルの積をCのループで直接計算します。
+ビルドされていない場合は coordinate_system がNumPy実装にフォールバックします。
+"""
+
+import numpy as np
+
+
+def transform_to_local(
+    const double[:, :] R,
+    const double[:] origin,
+    const double[:] p
+):
+    """R.T @ (p - origin) を計算"""
+    cdef double d0 = p[0] - origin[0]
+    cdef double d1 = p[1] - origin[1]
+    cdef double d2 = p[2] - origin[2]
+    cdef Py_ssize_t j
+    
+    out = np.empty(3)
+    cdef double[::1] o = out
+    for j in range(3):
+        o[j] = R[0, j] * d0 + R[1, j] * d1 + R[2, j] * d2
+    return out
+
+
+def transform_to_global(
+    const double[:, :] R,
+    const double[:] origin,
+    const double[:] p
+):
+    """origin + R @ p を計算"""
+    cdef double p0 = p[0]
+    cdef double p1 = p[1]
+    cdef double p2 = p[2]
+    cdef Py_ssize_t i
+    
+    out = np.empty(3)
+    cdef double[::1] o = out
+    for i in range(3):
+        o[i] = origin[i] + R[i, 0] * p0 + R[i, 1] * p1 + R[i, 2] * p2
+    return out
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+一括処理用カーネルの遅延ローダー
+
+coordinate_system と rotation_matrix が共有します。numba の読み込みは重いため、
+カーネルは初めて必要になった時点で _numba_kernels から読み込みます。
+"""
+
+from functools import lru_cache
+from typing import Optional, Protocol
+import numpy as np
+
+
+class BatchKernels(Protocol):
+    """_numba_kernels モジュールが提供する一括処理カーネルの型"""
+    
+    def to_local_batch(self, pts: np.ndarray, origin: np.ndarray, R: np.ndarray) -> np.ndarray: ...
+    def to_global_batch(self, pts: np.ndarray, origin: np.ndarray, R: np.ndarray) -> np.ndarray: ...
+    def euler_zyx_batch(self, roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray) -> np.ndarray: ...
+    def euler_xyz_batch(self, roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray) -> np.ndarray: ...
+
+
+@lru_cache(maxsize=None)
+def batch_kernels() -> Optional[BatchKernels]:
+    """
+    一括処理用のNumbaカーネルを初回使用時に読み込む
+    
+    (N, 3) @ (3, 3) では BLAS 呼び出しのオーバーヘッドが演算量を上回るため、
+    Numba が利用可能な場合は明示ループのカーネルで処理します。
+    
+    Returns:
+        カーネルモジュール. numba が無い場合は None
+    """
+    try:
+        from . import _numba_kernels
+    except ImportError:  # numba は任意依存
+        return None
+    return _numba_kernels
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Numbaで JIT コンパイルするカーネル群（任意依存）
+
+numba のインポートには時間がかかるため、このモジュールは各関数が
+初めて必要になった時点で読み込まれます。numba が無い場合は
+ImportError となり、呼び出し側はNumPy実装にフォールバックします。
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def to_local_batch(pts: np.ndarray, origin: np.ndarray, R: np.ndarray) -> np.ndarray:
+    """(pts - origin) @ R を明示的なループで計算"""
+    n = pts.shape[0]
+    out = np.empty((n, 3))
+    for i in range(n):
+        for j in range(3):
+            acc = 0.0
+            for k in range(3):
+                acc += (pts[i, k] - origin[k]) * R[k, j]
+            out[i, j] = acc
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def to_global_batch(pts: np.ndarray, origin: np.ndarray, R: np.ndarray) -> np.ndarray:
+    """origin + pts @ R.T を明示的なループで計算"""
+    n = pts.shape[0]
+    out = np.empty((n, 3))
+    for i in range(n):
+        for j in range(3):
+            acc = origin[j]
+            for k in range(3):
+                acc += pts[i, k] * R[j, k]
+            out[i, j] = acc
+    return out
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def euler_zyx_batch(roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray) -> np.ndarray:
+    """rot_x(roll) @ rot_y(pitch) @ rot_z(yaw) を姿勢ごとに並列計算"""
+    n = roll.shape[0]
+    out = np.empty((n, 3, 3))
+    for i in prange(n):
+        cr, sr = np.cos(roll[i]), np.sin(roll[i])
+        cp, sp = np.cos(pitch[i]), np.sin(pitch[i])
+        cy, sy = np.cos(yaw[i]), np.sin(yaw[i])
+        out[i, 0, 0] = cp*cy
+        out[i, 0, 1] = -cp*sy
+        out[i, 0, 2] = sp
+        out[i, 1, 0] = cr*sy + sr*sp*cy
+        out[i, 1, 1] = cr*cy - sr*sp*sy
+        out[i, 1, 2] = -sr*cp
+        out[i, 2, 0] = sr*sy - cr*sp*cy
+        out[i, 2, 1] = sr*cy + cr*sp*sy
+        out[i, 2, 2] = cr*cp
+    return out
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def euler_xyz_batch(roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray) -> np.ndarray:
+    """rot_z(yaw) @ rot_y(pitch) @ rot_x(roll) を姿勢ごとに並列計算"""
+    n = roll.shape[0]
+    out = np.empty((n, 3, 3))
+    for i in prange(n):
+        cr, sr = np.cos(roll[i]), np.sin(roll[i])
+        cp, sp = np.cos(pitch[i]), np.sin(pitch[i])
+        cy, sy = np.cos(yaw[i]), np.sin(yaw[i])
+        out[i, 0, 0] = cy*cp
+        out[i, 0, 1] = cy*sp*sr - sy*cr
+        out[i, 0, 2] = cy*sp*cr + sy*sr
+        out[i, 1, 0] = sy*cp
+        out[i, 1, 1] = sy*sp*sr + cy*cr
+        out[i, 1, 2] = sy*sp*cr - cy*sr
+        out[i, 2, 0] = -sp
+        out[i, 2, 1] = cp*sr
+        out[i, 2, 2] = cp*cr
+    return out
@@ -9,10 +9,37 @@ from typing import Optional, Union, Tuple
 import numpy as np
 import math
 
+try:
+    from . import _fast
+    _HAS_FAST = True
+except ImportError:  # C拡張が未ビルドの場合
+    _HAS_FAST = False
+
+from . import _kernels
+
 
 ArrayLike = Union[list, tuple, np.ndarray]
 
 
+def _as_points(points: ArrayLike) -> np.ndarray:
+    """点群を (N, 3) の float64 配列として取得"""
+    pts = np.asarray(points, dtype=np.float64)
+    if pts.ndim != 2 or pts.shape[1] != 3:
+        raise ValueError("Points must have shape (N, 3)")
+    return pts
+
+
+def _as_vector(vector: ArrayLike) -> np.ndarray:
+    """単一の点・ベクトルを (3,) の float64 配列として取得"""
+    v = np.asarray(vector, dtype=np.float64)
+    if v.shape != (3,):
+        raise ValueError(
+            "Point/vector must have shape (3,); "
+            "use transform_points_* for (N, 3) arrays"
+        )
+    return v
+
+
 class CoordinateSystem:
     """
     3D座標系を定義するクラス
@@ -25,6 +52,9 @@ class CoordinateSystem:
         x_axis (np.ndarray): X軸の単位方向ベクトル
         y_axis (np.ndarray): Y軸の単位方向ベクトル  
         z_axis (np.ndarray): Z軸の単位方向ベクトル
+    
+    各属性は内部バッファの読み取り専用ビューを返すプロパティで、代入はできません。
+    変更は set_origin, translate, rotate を通して行ってください。
     """
     
     def __init__(
@@ -46,48 +76,79 @@ class CoordinateSystem:
         Raises:
             ValueError: ゼロベクトルが渡された場合
         """
-        # デフォルト値の設定
-        self.origin = np.array(
-            origin if origin is not None else [0.0, 0.0, 0.0], 
-            dtype=float
-        )
+        # 原点と3軸を1つの (4, 3) バッファにまとめて保持する
+        # （小さな配列ごとのNumPy呼び出しオーバーヘッドを削減）
+        buf = np.empty((4, 3))
+        buf[0] = origin if origin is not None else (0.0, 0.0, 0.0)
+        buf[1] = x_axis if x_axis is not None else (1.0, 0.0, 0.0)
+        buf[2] = y_axis if y_axis is not None else (0.0, 1.0, 0.0)
+        buf[3] = z_axis if z_axis is not None else (0.0, 0.0, 1.0)
         
-        # デフォルトの軸ベクトル
-        default_x = np.array([1.0, 0.0, 0.0])
-        default_y = np.array([0.0, 1.0, 0.0])
-        default_z = np.array([0.0, 0.0, 1.0])
+        # 軸ベクトルを一括で正規化
+        axes = buf[1:]
+        norms = np.sqrt(np.einsum('ij,ij->i', axes, axes))
+        if norms.min() < 1e-10:
+            raise ValueError("Zero vector cannot be normalized")
+        axes /= norms[:, np.newaxis]
         
-        # 軸ベクトルの設定と正規化
-        self.x_axis = self._normalize_vector(
-            np.array(x_axis if x_axis is not None else default_x, dtype=float)
-        )
-        self.y_axis = self._normalize_vector(
-            np.array(y_axis if y_axis is not None else default_y, dtype=float)
-        )
-        self.z_axis = self._normalize_vector(
-            np.array(z_axis if z_axis is not None else default_z, dtype=float)
-        )
+        self._bind_buffer(buf)
         
         # 直交性をチェック
         self._validate_orthogonality()
     
-    def _normalize_vector(self, vector: np.ndarray) -> np.ndarray:
+    @classmethod
+    def _from_trusted_buffer(cls, buf: np.ndarray) -> 'CoordinateSystem':
         """
-        ベクトルを正規化
+        正規直交であることが保証された (4, 3) バッファから座標系を作成
+        
+        __init__ を経由せず、正規化と直交性チェックを省略します（内部用）。
         
         Args:
-            vector: 正規化するベクトル
+            buf: 原点と3軸を行に持つ (4, 3) 配列（そのまま保持される）
             
         Returns:
-            正規化されたベクトル
-            
-        Raises:
-            ValueError: ゼロベクトルの場合
+            新しい座標系インスタンス
         """
-        norm = np.linalg.norm(vector)
-        if norm < 1e-10:
-            raise ValueError("Zero vector cannot be normalized")
-        return vector / norm
+        self = cls.__new__(cls)
+        self._bind_buffer(buf)
+        return self
+    
+    def _bind_buffer(self, buf: np.ndarray) -> None:
+        """(4, 3) バッファを読み取り専用で保持し、各属性をそのビューとして設定"""
+        # 各属性はバッファの読み取り専用ビュー（コピーなし）
+        buf.flags.writeable = False
+        self._data = buf
+        self._origin: np.ndarray = buf[0]
+        self._x_axis: np.ndarray = buf[1]
+        self._y_axis: np.ndarray = buf[2]
+        self._z_axis: np.ndarray = buf[3]
+        
+        # 軸を行に持つビューは回転行列の転置 R.T（C連続）そのもの
+        self._axes: np.ndarray = buf[1:]
+        
+        # 回転行列・同次変換行列のキャッシュ（変更操作で無効化）
+        self._R_cache: Optional[np.ndarray] = None
+        self._T_cache: Optional[np.ndarray] = None
+    
+    @property
+    def origin(self) -> np.ndarray:
+        """原点座標（読み取り専用ビュー）"""
+        return self._origin
+    
+    @property
+    def x_axis(self) -> np.ndarray:
+        """X軸の単位方向ベクトル（読み取り専用ビュー）"""
+        return self._x_axis
+    
+    @property
+    def y_axis(self) -> np.ndarray:
+        """Y軸の単位方向ベクトル（読み取り専用ビュー）"""
+        return self._y_axis
+    
+    @property
+    def z_axis(self) -> np.ndarray:
+        """Z軸の単位方向ベクトル（読み取り専用ビュー）"""
+        return self._z_axis
     
     def _validate_orthogonality(self, tolerance: float = 1e-6) -> None:
         """
@@ -96,9 +157,12 @@ class CoordinateSystem:
         Args:
             tolerance: 許容誤差
         """
-        dot_xy = np.dot(self.x_axis, self.y_axis)
-        dot_yz = np.dot(self.y_axis, self.z_axis)
-        dot_zx = np.dot(self.z_axis, self.x_axis)
+        # グラム行列 G = A A^T の非対角成分が各軸同士の内積
+        axes = self._axes
+        gram = axes @ axes.T
+        dot_xy = gram[0, 1]
+        dot_yz = gram[1, 2]
+        dot_zx = gram[2, 0]
         
         if abs(dot_xy) > tolerance or abs(dot_yz) > tolerance or abs(dot_zx) > tolerance:
             print(
@@ -137,7 +201,7 @@ class CoordinateSystem:
     @classmethod
     def from_euler_angles(
         cls, 
-        origin: ArrayLike, 
+        origin: Optional[ArrayLike], 
         roll: float, 
         pitch: float, 
         yaw: float, 
@@ -147,7 +211,7 @@ class CoordinateSystem:
         オイラー角から座標系を作成（ZYXオーダー）
         
         Args:
-            origin: 原点座標
+            origin: 原点座標. None の場合は [0, 0, 0]
             roll: ロール角（X軸回転）
             pitch: ピッチ角（Y軸回転）
             yaw: ヨー角（Z軸回転）
@@ -161,45 +225,89 @@ class CoordinateSystem:
             pitch = math.radians(pitch)
             yaw = math.radians(yaw)
         
-        # ZYX オイラー角から回転行列を作成
+        # ZYX オイラー角から回転行列 R = Rz @ Ry @ Rx を作成
+        # （要素回転行列3つの積よりも、展開済みの式をスカラーで評価する方が高速）
         cos_r, sin_r = math.cos(roll), math.sin(roll)
         cos_p, sin_p = math.cos(pitch), math.sin(pitch)
         cos_y, sin_y = math.cos(yaw), math.sin(yaw)
         
-        rotation_matrix = np.array([
-            [cos_y*cos_p, cos_y*sin_p*sin_r - sin_y*cos_r, cos_y*sin_p*cos_r + sin_y*sin_r],
-            [sin_y*cos_p, sin_y*sin_p*sin_r + cos_y*cos_r, sin_y*sin_p*cos_r - cos_y*sin_r],
-            [-sin_p, cos_p*sin_r, cos_p*cos_r]
-        ])
+        # 共通の積を使い回し、各要素をスカラー代入で設定
+        # （ネストしたリストからの np.array 生成を避ける）
+        sp_sr = sin_p*sin_r
+        sp_cr = sin_p*cos_r
         
-        return cls.from_rotation_matrix(origin, rotation_matrix)
+        # 回転行列の列が各軸なので、バッファの軸部分の転置ビューへ直接書き込む
+        buf = np.empty((4, 3))
+        buf[0] = origin if origin is not None else (0.0, 0.0, 0.0)
+        R = buf[1:].T
+        R[0, 0] = cos_y*cos_p
+        R[0, 1] = cos_y*sp_sr - sin_y*cos_r
+        R[0, 2] = cos_y*sp_cr + sin_y*sin_r
+        R[1, 0] = sin_y*cos_p
+        R[1, 1] = sin_y*sp_sr + cos_y*cos_r
+        R[1, 2] = sin_y*sp_cr - cos_y*sin_r
+        R[2, 0] = -sin_p
+        R[2, 1] = cos_p*sin_r
+        R[2, 2] = cos_p*cos_r
+        
+        # 正規直交であることが保証されているため検証を省略
+        return cls._from_trusted_buffer(buf)
     
     def get_origin(self) -> np.ndarray:
-        """原点座標を取得"""
+        """
+        原点座標を取得
+        
+        結果は内部データの読み取り専用ビューです。
+        変更が必要な場合は get_origin_copy() を使用してください。
+        """
+        return self.origin
+    
+    def get_origin_copy(self) -> np.ndarray:
+        """原点座標の変更可能なコピーを取得"""
         return self.origin.copy()
     
     def get_x_axis(self) -> np.ndarray:
-        """X軸方向ベクトルを取得"""
-        return self.x_axis.copy()
+        """X軸方向ベクトルを取得（読み取り専用ビュー）"""
+        return self.x_axis
     
     def get_y_axis(self) -> np.ndarray:
-        """Y軸方向ベクトルを取得"""
-        return self.y_axis.copy()
+        """Y軸方向ベクトルを取得（読み取り専用ビュー）"""
+        return self.y_axis
     
     def get_z_axis(self) -> np.ndarray:
-        """Z軸方向ベクトルを取得"""
-        return self.z_axis.copy()
+        """Z軸方向ベクトルを取得（読み取り専用ビュー）"""
+        return self.z_axis
     
     def get_rotation_matrix(self) -> np.ndarray:
-        """この座標系の回転行列を取得"""
-        return np.column_stack([self.x_axis, self.y_axis, self.z_axis])
+        """
+        この座標系の回転行列を取得
+        
+        結果はキャッシュされた読み取り専用配列です。
+        変更が必要な場合は呼び出し側でコピーしてください。
+        """
+        if self._R_cache is None:
+            R = np.column_stack([self.x_axis, self.y_axis, self.z_axis])
+            R.flags.writeable = False
+            self._R_cache = R
+        return self._R_cache
     
     def get_transformation_matrix(self) -> np.ndarray:
-        """この座標系の同次変換行列を取得"""
-        transform = np.eye(4)
-        transform[:3, :3] = self.get_rotation_matrix()
-        transform[:3, 3] = self.origin
-        return transform
+        """
+        この座標系の同次変換行列を取得
+        
+        結果はキャッシュされた読み取り専用配列です。
+        変更が必要な場合は呼び出し側でコピーしてください。
+        """
+        if self._T_cache is None:
+            # np.eye による初期化や回転行列の生成を経由せず、バッファから直接設定
+            transform = np.empty((4, 4))
+            transform[:3, :3] = self._axes.T
+            transform[:3, 3] = self.origin
+            transform[3, :3] = 0.0
+            transform[3, 3] = 1.0
+            transform.flags.writeable = False
+            self._T_cache = transform
+        return self._T_cache
     
     def transform_point_to_local(self, global_point: ArrayLike) -> np.ndarray:
         """
@@ -210,16 +318,15 @@ class CoordinateSystem:
             
         Returns:
             ローカル座標系での点
+            
+        Raises:
+            ValueError: 点の形状が (3,) でない場合
         """
-        global_point = np.array(global_point)
-        relative_point = global_point - self.origin
-        
-        # この座標系の軸ベクトルに投影
-        local_x = np.dot(relative_point, self.x_axis)
-        local_y = np.dot(relative_point, self.y_axis)
-        local_z = np.dot(relative_point, self.z_axis)
-        
-        return np.array([local_x, local_y, local_z])
+        p = _as_vector(global_point)
+        if _HAS_FAST:
+            return _fast.transform_to_local(self.get_rotation_matrix(), self.origin, p)
+        local: np.ndarray = self._axes @ (p - self.origin)
+        return local
     
     def transform_point_to_global(self, local_point: ArrayLike) -> np.ndarray:
         """
@@ -230,16 +337,58 @@ class CoordinateSystem:
             
         Returns:
             グローバル座標系での点
+            
+        Raises:
+            ValueError: 点の形状が (3,) でない場合
+        """
+        p = _as_vector(local_point)
+        if _HAS_FAST:
+            return _fast.transform_to_global(self.get_rotation_matrix(), self.origin, p)
+        world: np.ndarray = self.origin + self.get_rotation_matrix() @ p
+        return world
+    
+    def transform_points_to_local(self, global_points: ArrayLike) -> np.ndarray:
+        """
+        グローバル座標の点群をこの座標系のローカル座標に一括変換
+        
+        Args:
+            global_points: グローバル座標系での点群 (N, 3)
+            
+        Returns:
+            ローカル座標系での点群 (N, 3)
+            
+        Raises:
+            ValueError: 点群の形状が (N, 3) でない場合
+        """
+        pts = _as_points(global_points)
+        R = self.get_rotation_matrix()
+        
+        kernels = _kernels.batch_kernels()
+        if kernels is not None:
+            return kernels.to_local_batch(pts, self.origin, R)
+        local: np.ndarray = (pts - self.origin) @ R
+        return local
+    
+    def transform_points_to_global(self, local_points: ArrayLike) -> np.ndarray:
         """
-        local_point = np.array(local_point)
+        この座標系のローカル座標の点群をグローバル座標に一括変換
         
-        # ローカル座標をグローバル座標に変換
-        global_point = (self.origin + 
-                       local_point[0] * self.x_axis + 
-                       local_point[1] * self.y_axis + 
-                       local_point[2] * self.z_axis)
+        Args:
+            local_points: ローカル座標系での点群 (N, 3)
+            
+        Returns:
+            グローバル座標系での点群 (N, 3)
+            
+        Raises:
+            ValueError: 点群の形状が (N, 3) でない場合
+        """
+        pts = _as_points(local_points)
         
-        return global_point
+        kernels = _kernels.batch_kernels()
+        if kernels is not None:
+            return kernels.to_global_batch(pts, self.origin, self.get_rotation_matrix())
+        world: np.ndarray = self.origin + pts @ self._axes
+        return world
     
     def transform_vector_to_local(self, global_vector: ArrayLike) -> np.ndarray:
         """
@@ -250,14 +399,13 @@ class CoordinateSystem:
             
         Returns:
             ローカル座標系でのベクトル
+            
+        Raises:
+            ValueError: ベクトルの形状が (3,) でない場合
         """
-        global_vector = np.array(global_vector)
-        
-        local_x = np.dot(global_vector, self.x_axis)
-        local_y = np.dot(global_vector, self.y_axis)
-        local_z = np.dot(global_vector, self.z_axis)
-        
-        return np.array([local_x, local_y, local_z])
+        v = _as_vector(global_vector)
+        local: np.ndarray = self._axes @ v
+        return local
     
     def transform_vector_to_global(self, local_vector: ArrayLike) -> np.ndarray:
         """
@@ -268,22 +416,31 @@ class CoordinateSystem:
             
         Returns:
             グローバル座標系でのベクトル
+            
+        Raises:
+            ValueError: ベクトルの形状が (3,) でない場合
         """
-        local_vector = np.array(local_vector)
-        
-        global_vector = (local_vector[0] * self.x_axis + 
-                        local_vector[1] * self.y_axis + 
-                        local_vector[2] * self.z_axis)
-        
-        return global_vector
+        v = _as_vector(local_vector)
+        world: np.ndarray = self.get_rotation_matrix() @ v
+        return world
     
     def set_origin(self, new_origin: ArrayLike) -> None:
         """原点を設定"""
-        self.origin = np.array(new_origin, dtype=float)
+        buf = self._data.copy()
+        buf[0] = new_origin
+        self._rebind_origin(buf)
     
     def translate(self, translation: ArrayLike) -> None:
         """座標系を平行移動"""
-        self.origin += np.array(translation)
+        buf = self._data.copy()
+        buf[0] += translation
+        self._rebind_origin(buf)
+    
+    def _rebind_origin(self, buf: np.ndarray) -> None:
+        """原点のみを変更したバッファに差し替える（回転行列のキャッシュは維持）"""
+        R = self._R_cache
+        self._bind_buffer(buf)
+        self._R_cache = R
     
     def rotate(self, rotation_matrix: np.ndarray) -> None:
         """
@@ -298,14 +455,18 @@ class CoordinateSystem:
         if rotation_matrix.shape != (3, 3):
             raise ValueError("Rotation matrix must be 3x3")
             
-        self.x_axis = rotation_matrix @ self.x_axis
-        self.y_axis = rotation_matrix @ self.y_axis
-        self.z_axis = rotation_matrix @ self.z_axis
+        # 軸を行に持つため、3軸まとめて A' = A @ R^T の1回の積で回転
+        buf = np.empty((4, 3))
+        buf[0] = self.origin
+        axes = buf[1:]
+        np.matmul(self._axes, rotation_matrix.T, out=axes)
+        
+        # 正規化（数値誤差対策）: 長さのずれが十分小さい場合は省略
+        norms_sq = np.einsum('ij,ij->i', axes, axes)
+        if any(abs(n - 1.0) > 1e-8 for n in norms_sq.tolist()):
+            axes /= np.sqrt(norms_sq)[:, np.newaxis]
         
-        # 正規化（数値誤差対策）
-        self.x_axis = self._normalize_vector(self.x_axis)
-        self.y_axis = self._normalize_vector(self.y_axis)
-        self.z_axis = self._normalize_vector(self.z_axis)
+        self._bind_buffer(buf)
     
     def __str__(self) -> str:
         """文字列表現"""
@@ -5,77 +5,314 @@
 3D空間における回転を表現する方向余弦行列の生成と操作を提供します。
 """
 
-from typing import Union
+from typing import Optional, SupportsFloat, Union
 import numpy as np
 import math
 
+from . import _kernels
 
-def rot_x(theta: Union[float, np.ndarray]) -> np.ndarray:
+
+# スカラー版回転行列の雛形（読み取り専用の単位行列）
+# コピー後に三角関数を含む4要素のみを書き換える
+_I3 = np.eye(3)
+_I3.flags.writeable = False
+
+# 度→ラジアンの換算係数
+_DEG2RAD = math.pi / 180.0
+
+# スカラーまたは配列の角度・三角関数値
+_Scalar = Union[float, np.ndarray]
+
+
+def _eye(dtype: type) -> np.ndarray:
+    """雛形から書き込み可能な単位行列を dtype で生成"""
+    return _I3.copy() if dtype is np.float64 else _I3.astype(dtype)
+
+
+def _is_scalar(theta: Union[float, np.ndarray]) -> bool:
+    """角度がスカラー（Pythonの数値または0次元配列）かどうかを判定"""
+    return isinstance(theta, (int, float)) or np.ndim(theta) == 0
+
+
+# (i, j) 平面内の回転で書き換える要素の添字 ((i, i), (j, j), (j, i), (i, j))
+# 添字のタプルを毎回組み立てないよう軸ごとに事前に作っておく
+_Plane = tuple[tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int]]
+
+
+def _plane(i: int, j: int) -> _Plane:
+    """(i, j) 平面内の回転で書き換える要素の添字を生成"""
+    return ((i, i), (j, j), (j, i), (i, j))
+
+
+def _fill_rot(R: np.ndarray, theta: SupportsFloat, plane: _Plane) -> np.ndarray:
+    """
+    単位行列 R の (i, j) 平面内の要素を回転角 theta の値に書き換える
+    
+    R[i, i] = R[j, j] = cos, R[j, i] = sin, R[i, j] = -sin となります。
+    """
+    ii, jj, ji, ij = plane
+    cos_theta = math.cos(theta)
+    sin_theta = math.sin(theta)
+    R[ii] = cos_theta
+    R[jj] = cos_theta
+    R[ji] = sin_theta
+    R[ij] = -sin_theta
+    return R
+
+
+def _quarter_turn_table(plane: _Plane) -> dict[float, np.ndarray]:
+    """π/2 の整数倍（-2π〜2π）の角度に対する回転行列表（読み取り専用）"""
+    table: dict[float, np.ndarray] = {}
+    for k in range(-4, 5):
+        theta = k * math.pi / 2
+        R = _fill_rot(_I3.copy(), theta, plane)
+        R.flags.writeable = False
+        table[theta] = R
+    return table
+
+
+_ROT_X_PLANE = _plane(1, 2)
+_ROT_Y_PLANE = _plane(2, 0)
+_ROT_Z_PLANE = _plane(0, 1)
+_ROT_X_QUARTER_TURNS = _quarter_turn_table(_ROT_X_PLANE)
+_ROT_Y_QUARTER_TURNS = _quarter_turn_table(_ROT_Y_PLANE)
+_ROT_Z_QUARTER_TURNS = _quarter_turn_table(_ROT_Z_PLANE)
+
+
+def _batch_rot(
+    theta: _Scalar,
+    i: int,
+    j: int,
+    dtype: type = np.float64,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    角度配列に対する (i, j) 平面内の回転行列をまとめて生成
+    
+    R[i, i] = R[j, j] = cos, R[j, i] = sin, R[i, j] = -sin となります。
+    cos/sin は NumPy の SIMD 実装で出力配列の該当要素へ直接書き込み、
+    一時配列を作りません。out を指定した場合はそこへ書き込みます。
+    """
+    theta = np.asarray(theta, dtype=np.float64)
+    R: np.ndarray
+    if out is None:
+        R = np.zeros(theta.shape + (3, 3), dtype=dtype)
+    else:
+        R = out
+        R[...] = 0.0
+    np.cos(theta, out=R[..., i, i])
+    np.sin(theta, out=R[..., j, i])
+    R[..., j, j] = R[..., i, i]
+    np.negative(R[..., j, i], out=R[..., i, j])
+    R[..., 3 - i - j, 3 - i - j] = 1.0
+    return R
+
+
+def _rot(
+    theta: _Scalar,
+    plane: _Plane,
+    quarter_turns: dict[float, np.ndarray],
+    dtype: type = np.float64,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    plane の平面内の回転行列を生成（rot_* と rot_*_into の共通実装）
+    
+    out を指定した場合はそこへ書き込みます。
+    """
+    # 軸に沿った回転は頻出するため、π/2 の整数倍と完全に一致する角度は
+    # 表から複製して三角関数と要素の書き込みを省く（それ以外の角度は辞書の参照1回分のみ増える）
+    if isinstance(theta, (int, float)):
+        R = quarter_turns.get(theta)
+    elif np.ndim(theta) == 0:  # 0次元配列はハッシュできないため表を引かない
+        R = None
+    else:
+        i, j = plane[3]
+        return _batch_rot(theta, i, j, dtype, out)
+    
+    if out is not None:
+        if R is not None:
+            out[...] = R
+            return out
+        out[...] = _I3
+        return _fill_rot(out, theta, plane)
+    if R is not None:
+        return R.copy() if dtype is np.float64 else R.astype(dtype)
+    return _fill_rot(_eye(dtype), theta, plane)
+
+
+def rot_x(theta: Union[float, np.ndarray], dtype: type = np.float64) -> np.ndarray:
     """
     X軸周りの回転行列を生成
     
     Args:
-        theta: 回転角度（ラジアン）
+        theta: 回転角度（ラジアン）. 配列の場合は各要素の回転行列をまとめて生成
+        dtype: 出力のデータ型（GPU・描画用途では np.float32 など）
         
     Returns:
-        3x3回転行列
+        3x3回転行列. thetaが配列の場合は theta.shape + (3, 3) の配列
     """
-    cos_theta = np.cos(theta)
-    sin_theta = np.sin(theta)
-    
-    return np.array([
-        [1, 0, 0],
-        [0, cos_theta, -sin_theta],
-        [0, sin_theta, cos_theta]
-    ])
+    return _rot(theta, _ROT_X_PLANE, _ROT_X_QUARTER_TURNS, dtype)
 
 
-def rot_y(theta: Union[float, np.ndarray]) -> np.ndarray:
+def rot_y(theta: Union[float, np.ndarray], dtype: type = np.float64) -> np.ndarray:
     """
     Y軸周りの回転行列を生成
     
     Args:
-        theta: 回転角度（ラジアン）
+        theta: 回転角度（ラジアン）. 配列の場合は各要素の回転行列をまとめて生成
+        dtype: 出力のデータ型（GPU・描画用途では np.float32 など）
         
     Returns:
-        3x3回転行列
+        3x3回転行列. thetaが配列の場合は theta.shape + (3, 3) の配列
     """
-    cos_theta = np.cos(theta)
-    sin_theta = np.sin(theta)
-    
-    return np.array([
-        [cos_theta, 0, sin_theta],
-        [0, 1, 0],
-        [-sin_theta, 0, cos_theta]
-    ])
+    return _rot(theta, _ROT_Y_PLANE, _ROT_Y_QUARTER_TURNS, dtype)
 
 
-def rot_z(theta: Union[float, np.ndarray]) -> np.ndarray:
+def rot_z(theta: Union[float, np.ndarray], dtype: type = np.float64) -> np.ndarray:
     """
     Z軸周りの回転行列を生成
     
     Args:
-        theta: 回転角度（ラジアン）
+        theta: 回転角度（ラジアン）. 配列の場合は各要素の回転行列をまとめて生成
+        dtype: 出力のデータ型（GPU・描画用途では np.float32 など）
         
     Returns:
-        3x3回転行列
+        3x3回転行列. thetaが配列の場合は theta.shape + (3, 3) の配列
+    """
+    return _rot(theta, _ROT_Z_PLANE, _ROT_Z_QUARTER_TURNS, dtype)
+
+
+def rot_x_into(theta: Union[float, np.ndarray], out: np.ndarray) -> np.ndarray:
+    """
+    X軸周りの回転行列を既存の配列に書き込む
+    
+    ループ内で毎回の配列確保を避けたい場合に、rot_x の代わりに使用します。
+    
+    Args:
+        theta: 回転角度（ラジアン）. 配列も可
+        out: 書き込み先の配列. 形状は theta の形状 + (3, 3)
+        
+    Returns:
+        out
+    """
+    return _rot(theta, _ROT_X_PLANE, _ROT_X_QUARTER_TURNS, out=out)
+
+
+def rot_y_into(theta: Union[float, np.ndarray], out: np.ndarray) -> np.ndarray:
     """
-    cos_theta = np.cos(theta)
-    sin_theta = np.sin(theta)
+    Y軸周りの回転行列を既存の配列に書き込む
+    
+    ループ内で毎回の配列確保を避けたい場合に、rot_y の代わりに使用します。
     
-    return np.array([
-        [cos_theta, -sin_theta, 0],
-        [sin_theta, cos_theta, 0],
-        [0, 0, 1]
-    ])
+    Args:
+        theta: 回転角度（ラジアン）. 配列も可
+        out: 書き込み先の配列. 形状は theta の形状 + (3, 3)
+        
+    Returns:
+        out
+    """
+    return _rot(theta, _ROT_Y_PLANE, _ROT_Y_QUARTER_TURNS, out=out)
+
+
+def rot_z_into(theta: Union[float, np.ndarray], out: np.ndarray) -> np.ndarray:
+    """
+    Z軸周りの回転行列を既存の配列に書き込む
+    
+    ループ内で毎回の配列確保を避けたい場合に、rot_z の代わりに使用します。
+    
+    Args:
+        theta: 回転角度（ラジアン）. 配列も可
+        out: 書き込み先の配列. 形状は theta の形状 + (3, 3)
+        
+    Returns:
+        out
+    """
+    return _rot(theta, _ROT_Z_PLANE, _ROT_Z_QUARTER_TURNS, out=out)
+
+
+def _fill_euler_zyx(
+    R: np.ndarray,
+    cr: _Scalar, sr: _Scalar,
+    cp: _Scalar, sp: _Scalar,
+    cy: _Scalar, sy: _Scalar
+) -> np.ndarray:
+    """rot_x(roll) @ rot_y(pitch) @ rot_z(yaw) の展開式を R[..., 3, 3] に書き込む"""
+    R[..., 0, 0] = cp*cy
+    R[..., 0, 1] = -cp*sy
+    R[..., 0, 2] = sp
+    R[..., 1, 0] = cr*sy + sr*sp*cy
+    R[..., 1, 1] = cr*cy - sr*sp*sy
+    R[..., 1, 2] = -sr*cp
+    R[..., 2, 0] = sr*sy - cr*sp*cy
+    R[..., 2, 1] = sr*cy + cr*sp*sy
+    R[..., 2, 2] = cr*cp
+    return R
+
+
+def _fill_euler_xyz(
+    R: np.ndarray,
+    cr: _Scalar, sr: _Scalar,
+    cp: _Scalar, sp: _Scalar,
+    cy: _Scalar, sy: _Scalar
+) -> np.ndarray:
+    """rot_z(yaw) @ rot_y(pitch) @ rot_x(roll) の展開式を R[..., 3, 3] に書き込む"""
+    R[..., 0, 0] = cy*cp
+    R[..., 0, 1] = cy*sp*sr - sy*cr
+    R[..., 0, 2] = cy*sp*cr + sy*sr
+    R[..., 1, 0] = sy*cp
+    R[..., 1, 1] = sy*sp*sr + cy*cr
+    R[..., 1, 2] = sy*sp*cr - cy*sr
+    R[..., 2, 0] = -sp
+    R[..., 2, 1] = cp*sr
+    R[..., 2, 2] = cp*cr
+    return R
+
+
+def _euler_zyx(
+    roll: SupportsFloat, pitch: SupportsFloat, yaw: SupportsFloat, dtype: type
+) -> np.ndarray:
+    """rot_x(roll) @ rot_y(pitch) @ rot_z(yaw) を展開した式で計算"""
+    return _fill_euler_zyx(
+        np.empty((3, 3), dtype=dtype),
+        math.cos(roll), math.sin(roll),
+        math.cos(pitch), math.sin(pitch),
+        math.cos(yaw), math.sin(yaw),
+    )
+
+
+def _euler_xyz(
+    roll: SupportsFloat, pitch: SupportsFloat, yaw: SupportsFloat, dtype: type
+) -> np.ndarray:
+    """rot_z(yaw) @ rot_y(pitch) @ rot_x(roll) を展開した式で計算"""
+    return _fill_euler_xyz(
+        np.empty((3, 3), dtype=dtype),
+        math.cos(roll), math.sin(roll),
+        math.cos(pitch), math.sin(pitch),
+        math.cos(yaw), math.sin(yaw),
+    )
+
+
+# 回転順序 -> スカラー版の展開式
+_EULER_BUILDERS = {
+    'ZYX': _euler_zyx,  # ヨー→ピッチ→ロールの順
+    'XYZ': _euler_xyz,  # ロール→ピッチ→ヨーの順
+}
+
+# 回転順序 -> (一括版の展開式, Numbaカーネル名)
+_EULER_BATCH_BUILDERS = {
+    'ZYX': (_fill_euler_zyx, 'euler_zyx_batch'),
+    'XYZ': (_fill_euler_xyz, 'euler_xyz_batch'),
+}
 
 
 def euler_to_rotation_matrix(
-    roll: float, 
-    pitch: float, 
-    yaw: float, 
+    roll: _Scalar, 
+    pitch: _Scalar, 
+    yaw: _Scalar, 
     order: str = 'ZYX',
-    angle_unit: str = 'rad'
+    angle_unit: str = 'rad',
+    dtype: type = np.float64
 ) -> np.ndarray:
     """
     オイラー角から回転行列を生成
@@ -86,25 +323,169 @@ def euler_to_rotation_matrix(
         yaw: ヨー角
         order: 回転順序 ('ZYX', 'XYZ', etc.)
         angle_unit: 角度の単位 ('rad' or 'deg')
+        dtype: 出力のデータ型（GPU・描画用途では np.float32 など）
         
     Returns:
         3x3回転行列
     """
     if angle_unit == 'deg':
-        roll = math.radians(roll)
-        pitch = math.radians(pitch)
-        yaw = math.radians(yaw)
-    
-    if order == 'ZYX':
-        # ヨー→ピッチ→ロールの順
-        R = rot_x(roll) @ rot_y(pitch) @ rot_z(yaw)
-    elif order == 'XYZ':
-        # ロール→ピッチ→ヨーの順
-        R = rot_z(yaw) @ rot_y(pitch) @ rot_x(roll)
-    else:
-        raise ValueError(f"Unsupported rotation order: {order}")
+        return euler_deg_to_rotation_matrix(roll, pitch, yaw, order, dtype)
+    return euler_rad_to_rotation_matrix(roll, pitch, yaw, order, dtype)
+
+
+def euler_rad_to_rotation_matrix(
+    roll: _Scalar,
+    pitch: _Scalar,
+    yaw: _Scalar,
+    order: str = 'ZYX',
+    dtype: type = np.float64
+) -> np.ndarray:
+    """
+    ラジアンで与えたオイラー角から回転行列を生成
     
-    return R
+    angle_unit の判定を省いた euler_to_rotation_matrix の特化版です。
+    
+    Args:
+        roll: ロール角（ラジアン）
+        pitch: ピッチ角（ラジアン）
+        yaw: ヨー角（ラジアン）
+        order: 回転順序 ('ZYX', 'XYZ')
+        dtype: 出力のデータ型
+        
+    Returns:
+        3x3回転行列
+    """
+    if not (_is_scalar(roll) and _is_scalar(pitch) and _is_scalar(yaw)):
+        return euler_to_rotation_matrix_batch(roll, pitch, yaw, order, 'rad', dtype)
+    
+    try:
+        build = _EULER_BUILDERS[order]
+    except KeyError:
+        raise ValueError(f"Unsupported rotation order: {order}") from None
+    
+    # 恒等回転・単軸回転は回転順序に依らず要素回転行列そのもの
+    if pitch == 0 and yaw == 0:
+        if roll == 0:
+            return _eye(dtype)
+        return rot_x(roll, dtype)
+    if roll == 0 and yaw == 0:
+        return rot_y(pitch, dtype)
+    if roll == 0 and pitch == 0:
+        return rot_z(yaw, dtype)
+    
+    return build(roll, pitch, yaw, dtype)
+
+
+def euler_deg_to_rotation_matrix(
+    roll: _Scalar,
+    pitch: _Scalar,
+    yaw: _Scalar,
+    order: str = 'ZYX',
+    dtype: type = np.float64
+) -> np.ndarray:
+    """
+    度で与えたオイラー角から回転行列を生成
+    
+    angle_unit の判定を省いた euler_to_rotation_matrix の特化版です。
+    
+    Args:
+        roll: ロール角（度）
+        pitch: ピッチ角（度）
+        yaw: ヨー角（度）
+        order: 回転順序 ('ZYX', 'XYZ')
+        dtype: 出力のデータ型
+        
+    Returns:
+        3x3回転行列
+    """
+    if not (_is_scalar(roll) and _is_scalar(pitch) and _is_scalar(yaw)):
+        return euler_to_rotation_matrix_batch(roll, pitch, yaw, order, 'deg', dtype)
+    return euler_rad_to_rotation_matrix(
+        roll * _DEG2RAD, pitch * _DEG2RAD, yaw * _DEG2RAD, order, dtype
+    )
+
+
+def euler_to_rotation_matrix_batch(
+    roll: _Scalar,
+    pitch: _Scalar,
+    yaw: _Scalar,
+    order: str = 'ZYX',
+    angle_unit: str = 'rad',
+    dtype: type = np.float64
+) -> np.ndarray:
+    """
+    オイラー角の配列から回転行列をまとめて生成
+    
+    軌跡上の N 個の姿勢などを Python ループなしで変換します。
+    numba が利用可能な場合は並列化したカーネルで計算します。
+    
+    Args:
+        roll: ロール角の配列
+        pitch: ピッチ角の配列
+        yaw: ヨー角の配列
+        order: 回転順序 ('ZYX', 'XYZ')
+        angle_unit: 角度の単位 ('rad' or 'deg')
+        dtype: 出力のデータ型（GPU・描画用途では np.float32 など）
+        
+    Returns:
+        ブロードキャスト後の角度配列の形状 + (3, 3) の回転行列配列
+    """
+    try:
+        fill, kernel_name = _EULER_BATCH_BUILDERS[order]
+    except KeyError:
+        raise ValueError(f"Unsupported rotation order: {order}") from None
+    
+    roll, pitch, yaw = np.broadcast_arrays(
+        np.asarray(roll, dtype=np.float64),
+        np.asarray(pitch, dtype=np.float64),
+        np.asarray(yaw, dtype=np.float64),
+    )
+    if angle_unit == 'deg':
+        roll, pitch, yaw = roll * _DEG2RAD, pitch * _DEG2RAD, yaw * _DEG2RAD
+    shape = roll.shape
+    
+    kernels = _kernels.batch_kernels()
+    if kernels is not None:
+        R: np.ndarray = getattr(kernels, kernel_name)(
+            np.ascontiguousarray(roll).ravel(),
+            np.ascontiguousarray(pitch).ravel(),
+            np.ascontiguousarray(yaw).ravel(),
+        )
+        return R.reshape(shape + (3, 3)).astype(dtype, copy=False)
+    
+    return fill(
+        np.empty(shape + (3, 3), dtype=dtype),
+        np.cos(roll), np.sin(roll),
+        np.cos(pitch), np.sin(pitch),
+        np.cos(yaw), np.sin(yaw),
+    )
+
+
+def _matrix_to_euler_zyx(R: np.ndarray) -> tuple[float, float, float]:
+    """ZYX順序で (roll, pitch, yaw) をラジアンで抽出"""
+    # 数値誤差で |sin(pitch)| が1を超えると asin が失敗するためクリップ
+    sp = -float(R[2, 0])
+    if sp > 1.0:
+        sp = 1.0
+    elif sp < -1.0:
+        sp = -1.0
+    pitch = math.asin(sp)
+    
+    # cos(pitch)^2 = 1 - sin(pitch)^2 （|cos(pitch)| > 1e-6 と同値）
+    if 1.0 - sp*sp > 1e-12:
+        roll = math.atan2(R[2, 1], R[2, 2])
+        yaw = math.atan2(R[1, 0], R[0, 0])
+    else:
+        # ジンバルロック
+        roll = 0
+        yaw = math.atan2(-R[0, 1], R[1, 1])
+    return roll, pitch, yaw
+
+
+# 回転順序 -> 回転行列からの抽出関数
+_EULER_EXTRACTORS = {
+    'ZYX': _matrix_to_euler_zyx,
+}
 
 
 def rotation_matrix_to_euler(
@@ -126,19 +507,11 @@ def rotation_matrix_to_euler(
     if R.shape != (3, 3):
         raise ValueError("Rotation matrix must be 3x3")
     
-    if order == 'ZYX':
-        # ZYX順序での抽出
-        pitch = math.asin(-R[2, 0])
-        
-        if abs(math.cos(pitch)) > 1e-6:
-            roll = math.atan2(R[2, 1], R[2, 2])
-            yaw = math.atan2(R[1, 0], R[0, 0])
-        else:
-            # ジンバルロック
-            roll = 0
-            yaw = math.atan2(-R[0, 1], R[1, 1])
-    else:
-        raise ValueError(f"Unsupported rotation order: {order}")
+    try:
+        extract = _EULER_EXTRACTORS[order]
+    except KeyError:
+        raise ValueError(f"Unsupported rotation order: {order}") from None
+    roll, pitch, yaw = extract(R)
     
     if angle_unit == 'deg':
         roll = math.degrees(roll)
@@ -148,6 +521,36 @@ def rotation_matrix_to_euler(
     return roll, pitch, yaw
 
 
+def apply_rotation(R: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    回転行列を点群（またはベクトル）にまとめて適用
+    
+    各点 p について R @ p を計算します。点ごとに Python で変換するより
+    はるかに高速なため、多数の点を回転する場合はこの関数を使用してください。
+    R が (..., 3, 3) の場合は先頭の次元ごとに対応する点群へ適用します。
+    
+    Args:
+        R: 3x3回転行列、または (..., 3, 3) の回転行列配列
+        points: (3,) のベクトル、(N, 3) の点群、または (..., N, 3) の点群配列
+        
+    Returns:
+        回転後の点群（points と同じ形状. R が配列の場合はブロードキャスト後の形状）
+        
+    Raises:
+        ValueError: R または points の形状が不正な場合
+    """
+    R = np.asarray(R)
+    pts = np.asarray(points)
+    if R.ndim < 2 or R.shape[-2:] != (3, 3):
+        raise ValueError("Rotation matrix must be 3x3")
+    if pts.ndim < 1 or pts.shape[-1] != 3:
+        raise ValueError("Points must have shape (..., 3)")
+    
+    # p' = R @ p を行ベクトルの点群に対して p' = p @ R^T として一括計算
+    rotated: np.ndarray = pts @ np.swapaxes(R, -1, -2)
+    return rotated
+
+
 def is_rotation_matrix(R: np.ndarray, tolerance: float = 1e-6) -> bool:
     """
     行列が回転行列かどうかを判定
@@ -162,15 +565,15 @@ def is_rotation_matrix(R: np.ndarray, tolerance: float = 1e-6) -> bool:
     if R.shape != (3, 3):
         return False
     
-    # 直交性の確認: R @ R.T = I
-    should_be_identity = R @ R.T
-    identity = np.eye(3)
-    if not np.allclose(should_be_identity, identity, atol=tolerance):
-        return False
-    
-    # 行列式が1であることを確認
-    det = np.linalg.det(R)
-    if not np.isclose(det, 1.0, atol=tolerance):
+    # 直交性の確認: ||R @ R.T - I||_F < tolerance
+    R = np.asarray(R, dtype=np.float64)
+    M = R @ R.T
+    M.flat[::4] -= 1.0
+    if math.sqrt((M*M).sum()) >= tolerance:
         return False
     
-    return True
+    # 直交行列の行列式は ±1 なので、符号だけで反射を除外できる（3x3の余因子展開）
+    det = (R[0, 0]*(R[1, 1]*R[2, 2] - R[1, 2]*R[2, 1])
+           - R[0, 1]*(R[1, 0]*R[2, 2] - R[1, 2]*R[2, 0])
+           + R[0, 2]*(R[1, 0]*R[2, 1] - R[1, 1]*R[2, 0]))
+    return bool(det > 0)
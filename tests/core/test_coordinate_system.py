@@ -5,6 +5,7 @@ CoordinateSystemクラスのテスト
 import numpy as np
 import pytest
 import math
+from mathematics_simulator.core import _kernels
 from mathematics_simulator.core.coordinate_system import CoordinateSystem
 
 
@@ -64,6 +65,12 @@ class TestCoordinateSystem:
         # 90度回転後のX軸は元のY軸方向になるはず
         np.testing.assert_array_almost_equal(coords.get_x_axis(), [0, 1, 0], decimal=10)
     
+    def test_from_euler_angles_default_origin(self):
+        """原点に None を渡した場合は原点 [0, 0, 0] となることのテスト"""
+        coords = CoordinateSystem.from_euler_angles(None, 0.1, 0.2, 0.3)
+        
+        np.testing.assert_array_equal(coords.get_origin(), [0, 0, 0])
+    
     def test_from_rotation_matrix(self):
         """回転行列からの作成テスト"""
         origin = [0, 0, 0]
@@ -97,6 +104,45 @@ class TestCoordinateSystem:
         recovered_global = coords.transform_point_to_global(local_point)
         np.testing.assert_array_almost_equal(recovered_global, global_point)
     
+    @pytest.mark.parametrize("use_kernels", [True, False])
+    def test_batch_point_transformation(self, monkeypatch, use_kernels):
+        """点群の一括座標変換のテスト（Numbaカーネル・NumPy実装の両方）"""
+        if not use_kernels:
+            monkeypatch.setattr(_kernels, "batch_kernels", lambda: None)
+        coords = CoordinateSystem.from_euler_angles([1, 2, 3], 30, 45, 60, 'deg')
+        
+        # 単一点から大きめの点群まで確認
+        for n in (1, 10, 200):
+            global_points = np.random.default_rng(0).normal(size=(n, 3))
+            local_points = coords.transform_points_to_local(global_points)
+            
+            assert local_points.shape == (n, 3)
+            axes = (coords.x_axis, coords.y_axis, coords.z_axis)
+            expected = [[np.dot(p - coords.origin, a) for a in axes] for p in global_points]
+            np.testing.assert_array_almost_equal(local_points, expected)
+            
+            # 逆変換のテスト
+            recovered = coords.transform_points_to_global(local_points)
+            np.testing.assert_array_almost_equal(recovered, global_points)
+    
+    def test_batch_point_shape_error(self):
+        """点群の形状エラーのテスト"""
+        coords = CoordinateSystem()
+        with pytest.raises(ValueError, match="Points must have shape"):
+            coords.transform_points_to_local([[1, 2], [3, 4]])
+    
+    def test_fast_extension_matches_numpy(self):
+        """C拡張による単一点変換がNumPy実装と一致することのテスト"""
+        _fast = pytest.importorskip("mathematics_simulator.core._fast")
+        coords = CoordinateSystem.from_euler_angles([1, 2, 3], 30, 45, 60, 'deg')
+        R = coords.get_rotation_matrix()
+        
+        for p in np.random.default_rng(0).normal(size=(10, 3)):
+            np.testing.assert_allclose(
+                _fast.transform_to_local(R, coords.origin, p), R.T @ (p - coords.origin))
+            np.testing.assert_allclose(
+                _fast.transform_to_global(R, coords.origin, p), coords.origin + R @ p)
+    
     def test_vector_transformation(self):
         """ベクトル変換のテスト"""
         # Z軸周り90度回転した座標系
@@ -114,6 +160,20 @@ class TestCoordinateSystem:
         recovered_global = coords.transform_vector_to_global(local_vector)
         np.testing.assert_array_almost_equal(recovered_global, global_vector)
     
+    def test_single_transform_rejects_point_arrays(self):
+        """単一点・ベクトル変換が (N, 3) 配列を黙って誤変換しないことのテスト"""
+        coords = CoordinateSystem.from_euler_angles([1, 2, 3], 10, 20, 30, 'deg')
+        points = np.arange(9.0).reshape(3, 3)
+    
+        for transform in (coords.transform_point_to_local,
+                          coords.transform_point_to_global,
+                          coords.transform_vector_to_local,
+                          coords.transform_vector_to_global):
+            with pytest.raises(ValueError):
+                transform(points)
+            with pytest.raises(ValueError):
+                transform([1.0, 2.0])
+
     def test_rotation_matrix_property(self):
         """回転行列取得のテスト"""
         coords = CoordinateSystem.from_euler_angles([0, 0, 0], 30, 45, 60, 'deg')
@@ -145,6 +205,47 @@ class TestCoordinateSystem:
         # 原点が正しく設定されているはず
         np.testing.assert_array_equal(transform[:3, 3], origin)
     
+    def test_cached_matrices_invalidation(self):
+        """回転行列・同次変換行列キャッシュの無効化テスト"""
+        coords = CoordinateSystem()
+        R = coords.get_rotation_matrix()
+        T = coords.get_transformation_matrix()
+        
+        # 変更がなければ同じ配列が返り、読み取り専用である
+        assert coords.get_rotation_matrix() is R
+        assert coords.get_transformation_matrix() is T
+        assert not R.flags.writeable
+        assert not T.flags.writeable
+        
+        coords.translate([1, 2, 3])
+        np.testing.assert_array_equal(coords.get_transformation_matrix()[:3, 3], [1, 2, 3])
+        
+        coords.rotate(np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]]))
+        np.testing.assert_array_almost_equal(coords.get_rotation_matrix()[:, 0], [0, 1, 0])
+        np.testing.assert_array_almost_equal(
+            coords.get_transformation_matrix()[:3, 0], [0, 1, 0]
+        )
+    
+    def test_readonly_getters(self):
+        """取得した原点・軸が読み取り専用であることのテスト"""
+        coords = CoordinateSystem([1, 2, 3])
+        
+        with pytest.raises(ValueError):
+            coords.get_origin()[0] = 10
+        with pytest.raises(ValueError):
+            coords.get_x_axis()[0] = 10
+        
+        # 属性への代入で内部状態が不整合になることを防ぐ
+        with pytest.raises(AttributeError):
+            coords.origin = [0, 0, 0]
+        with pytest.raises(AttributeError):
+            coords.x_axis = [0, 1, 0]
+        
+        # コピーは変更可能で、元の座標系には影響しない
+        origin = coords.get_origin_copy()
+        origin[0] = 10
+        np.testing.assert_array_equal(coords.get_origin(), [1, 2, 3])
+    
     def test_translation(self):
         """平行移動のテスト"""
         coords = CoordinateSystem()
@@ -174,6 +275,16 @@ class TestCoordinateSystem:
         np.testing.assert_array_almost_equal(coords.get_y_axis(), [-1, 0, 0])
         np.testing.assert_array_almost_equal(coords.get_z_axis(), [0, 0, 1])
     
+    def test_rotation_renormalization(self):
+        """回転後の軸の再正規化テスト"""
+        coords = CoordinateSystem()
+        
+        # 数値誤差で長さがずれた回転行列
+        coords.rotate(np.eye(3) * 1.001)
+        
+        for axis in (coords.x_axis, coords.y_axis, coords.z_axis):
+            assert np.isclose(np.linalg.norm(axis), 1.0)
+    
     def test_string_representation(self):
         """文字列表現のテスト"""
         coords = CoordinateSystem()
@@ -5,8 +5,11 @@
 import numpy as np
 import pytest
 import math
+from mathematics_simulator.core import _kernels
 from mathematics_simulator.core.rotation_matrix import (
-    rot_x, rot_y, rot_z, euler_to_rotation_matrix, 
+    rot_x, rot_y, rot_z, rot_x_into, rot_y_into, rot_z_into,
+    euler_to_rotation_matrix, euler_to_rotation_matrix_batch,
+    euler_deg_to_rotation_matrix, euler_rad_to_rotation_matrix, apply_rotation,
     rotation_matrix_to_euler, is_rotation_matrix
 )
 
@@ -59,6 +62,44 @@ class TestRotationMatrix:
         np.testing.assert_array_almost_equal(R, expected)
         assert is_rotation_matrix(R)
     
+    def test_rot_quarter_turn_copy(self):
+        """π/2 の整数倍の回転行列を書き換えても後続の呼び出しに影響しないことのテスト"""
+        for rot_func in [rot_x, rot_y, rot_z]:
+            expected = rot_func(math.pi/2).copy()
+            R = rot_func(math.pi/2)
+            R[:] = 0.0
+            np.testing.assert_array_equal(rot_func(math.pi/2), expected)
+            
+            # 表を使わない経路（0次元配列や float32）と一致する
+            np.testing.assert_array_equal(rot_func(np.array(math.pi/2)), expected)
+            np.testing.assert_allclose(rot_func(math.pi/2, dtype=np.float32), expected, atol=1e-7)
+    
+    def test_rot_batch(self):
+        """角度配列に対する一括生成のテスト"""
+        thetas = np.linspace(-math.pi, math.pi, 7)
+        
+        for rot_func in [rot_x, rot_y, rot_z]:
+            R = rot_func(thetas)
+            assert R.shape == (7, 3, 3)
+            for i, theta in enumerate(thetas):
+                np.testing.assert_array_almost_equal(R[i], rot_func(float(theta)))
+            
+            # 多次元の角度配列
+            assert rot_func(thetas.reshape(7, 1)).shape == (7, 1, 3, 3)
+    
+    def test_rot_into(self):
+        """既存配列への書き込み版のテスト"""
+        thetas = np.linspace(-math.pi, math.pi, 7)
+        
+        for rot_func, into_func in [(rot_x, rot_x_into), (rot_y, rot_y_into), (rot_z, rot_z_into)]:
+            out = np.full((3, 3), np.nan)
+            assert into_func(0.4, out) is out
+            np.testing.assert_array_equal(out, rot_func(0.4))
+            
+            out = np.full((7, 3, 3), np.nan)
+            assert into_func(thetas, out) is out
+            np.testing.assert_array_almost_equal(out, rot_func(thetas))
+    
     def test_euler_to_rotation_matrix_zyx(self):
         """オイラー角から回転行列への変換テスト (ZYX)"""
         roll, pitch, yaw = 0, 0, 90  # Z軸90度回転のみ
@@ -75,6 +116,79 @@ class TestRotationMatrix:
         expected = rot_x(math.pi/2)
         np.testing.assert_array_almost_equal(R, expected)
     
+    def test_euler_to_rotation_matrix_composition(self):
+        """オイラー角からの回転行列が要素回転の積と一致することのテスト"""
+        roll, pitch, yaw = 0.3, -0.7, 1.2
+        
+        R = euler_to_rotation_matrix(roll, pitch, yaw, 'ZYX')
+        np.testing.assert_array_almost_equal(R, rot_x(roll) @ rot_y(pitch) @ rot_z(yaw))
+        
+        R = euler_to_rotation_matrix(roll, pitch, yaw, 'XYZ')
+        np.testing.assert_array_almost_equal(R, rot_z(yaw) @ rot_y(pitch) @ rot_x(roll))
+    
+    def test_euler_unit_specializations(self):
+        """度・ラジアン特化版が euler_to_rotation_matrix と一致することのテスト"""
+        for order in ['ZYX', 'XYZ']:
+            np.testing.assert_array_equal(
+                euler_deg_to_rotation_matrix(30, 45, 60, order),
+                euler_to_rotation_matrix(30, 45, 60, order, 'deg'))
+            np.testing.assert_array_equal(
+                euler_rad_to_rotation_matrix(0.3, -0.7, 1.2, order),
+                euler_to_rotation_matrix(0.3, -0.7, 1.2, order))
+    
+    def test_euler_to_rotation_matrix_single_axis(self):
+        """恒等回転・単軸回転の近道が要素回転と一致することのテスト"""
+        for order in ['ZYX', 'XYZ']:
+            np.testing.assert_array_equal(euler_to_rotation_matrix(0, 0, 0, order), np.eye(3))
+            np.testing.assert_array_almost_equal(euler_to_rotation_matrix(0.4, 0, 0, order), rot_x(0.4))
+            np.testing.assert_array_almost_equal(euler_to_rotation_matrix(0, 0.4, 0, order), rot_y(0.4))
+            np.testing.assert_array_almost_equal(euler_to_rotation_matrix(0, 0, 0.4, order), rot_z(0.4))
+        
+        # 近道より前に回転順序を検証する
+        with pytest.raises(ValueError):
+            euler_to_rotation_matrix(0, 0, 0, 'ABC')
+    
+    @pytest.mark.parametrize("use_kernels", [True, False])
+    def test_euler_to_rotation_matrix_batch(self, monkeypatch, use_kernels):
+        """オイラー角配列からの一括生成のテスト（Numbaカーネル・NumPy実装の両方）"""
+        if not use_kernels:
+            monkeypatch.setattr(_kernels, "batch_kernels", lambda: None)
+        rng = np.random.default_rng(0)
+        roll, pitch, yaw = rng.uniform(-math.pi, math.pi, (3, 50))
+        
+        for order in ['ZYX', 'XYZ']:
+            R = euler_to_rotation_matrix_batch(roll, pitch, yaw, order)
+            assert R.shape == (50, 3, 3)
+            for i in range(50):
+                np.testing.assert_array_almost_equal(
+                    R[i], euler_to_rotation_matrix(roll[i], pitch[i], yaw[i], order))
+            
+            # 配列入力は一括版に委譲される
+            np.testing.assert_array_almost_equal(
+                euler_to_rotation_matrix(roll, pitch, yaw, order), R)
+        
+        # 度数法とブロードキャスト
+        R = euler_to_rotation_matrix([0, 90], 0, 0, 'XYZ', 'deg')
+        np.testing.assert_array_almost_equal(R[1], rot_x(math.pi/2))
+        
+        with pytest.raises(ValueError):
+            euler_to_rotation_matrix_batch(roll, pitch, yaw, 'ABC')
+    
+    def test_float32_output(self):
+        """dtype 指定による float32 出力のテスト"""
+        thetas = np.linspace(-1.0, 1.0, 5)
+        
+        for rot_func in [rot_x, rot_y, rot_z]:
+            for theta in [0.4, thetas]:
+                R = rot_func(theta, dtype=np.float32)
+                assert R.dtype == np.float32
+                np.testing.assert_allclose(R, rot_func(theta), atol=1e-6)
+        
+        for angles in [(0, 0, 0), (0.3, 0, 0), (0.3, -0.7, 1.2), (thetas, thetas, thetas)]:
+            R = euler_to_rotation_matrix(*angles, dtype=np.float32)
+            assert R.dtype == np.float32
+            np.testing.assert_allclose(R, euler_to_rotation_matrix(*angles), atol=1e-6)
+    
     def test_rotation_matrix_to_euler_zyx(self):
         """回転行列からオイラー角への変換テスト"""
         # 既知のオイラー角
@@ -91,6 +205,45 @@ class TestRotationMatrix:
         assert np.isclose(pitch, original_pitch)
         assert np.isclose(yaw, original_yaw)
     
+    def test_rotation_matrix_to_euler_gimbal_lock(self):
+        """ジンバルロック付近と数値誤差で |R[2,0]| > 1 となる場合のテスト"""
+        R = np.array([
+            [0.0, 0.0, -1.0],
+            [0.0, 1.0, 0.0],
+            [1.0 + 1e-12, 0.0, 0.0]
+        ])
+        roll, pitch, yaw = rotation_matrix_to_euler(R)
+        
+        assert np.isclose(pitch, -math.pi/2)
+        assert roll == 0
+        assert np.isclose(yaw, 0.0)
+    
+    def test_apply_rotation(self):
+        """点群への回転の一括適用のテスト"""
+        rng = np.random.default_rng(0)
+        R = euler_to_rotation_matrix(0.3, -0.7, 1.2)
+        points = rng.normal(size=(20, 3))
+        
+        rotated = apply_rotation(R, points)
+        assert rotated.shape == (20, 3)
+        for p, q in zip(points, rotated):
+            np.testing.assert_array_almost_equal(q, R @ p)
+        
+        # 単一ベクトル
+        np.testing.assert_array_almost_equal(apply_rotation(R, points[0]), R @ points[0])
+        
+        # 回転行列ごとの点群
+        Rs = euler_to_rotation_matrix_batch(*rng.uniform(-1, 1, (3, 4)))
+        batch = rng.normal(size=(4, 20, 3))
+        rotated = apply_rotation(Rs, batch)
+        for k in range(4):
+            np.testing.assert_array_almost_equal(rotated[k], apply_rotation(Rs[k], batch[k]))
+        
+        with pytest.raises(ValueError):
+            apply_rotation(R, np.zeros((20, 2)))
+        with pytest.raises(ValueError):
+            apply_rotation(np.eye(2), points)
+    
     def test_is_rotation_matrix_valid(self):
         """有効な回転行列の判定テスト"""
         # 単位行列